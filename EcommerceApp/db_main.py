@@ -1,10 +1,16 @@
-import psycopg2
-from psycopg2 import Error
+import argparse
+import sys
+
 import modules 
 
+# psycopg2 is imported only when a connection is actually opened, so
+# `--help` and argument errors return immediately
+
 # //************************ DATABASE CONNECTION ***********************//
 
 def get_connection():
+    import psycopg2
+
     host_name = input("Host: ").strip()
     port_input = input("Port: ").strip()
     dbname = input("Database name: ").strip()
@@ -27,6 +33,20 @@ def get_connection():
         print("Please try again.\n")
         return get_connection() 
 
+def connect(host=None, port=None, dbname=None, user=None):
+    # Non-interactive: anything not given falls back to libpq's PGHOST, PGPORT,
+    # PGDATABASE, PGUSER and PGPASSWORD environment variables
+    import psycopg2
+
+    params = dict(host=host, port=port, dbname=dbname, user=user)
+    try:
+        conn = psycopg2.connect(**{k: v for k, v in params.items() if v})
+    except Exception as e:
+        print("Failed to connect:", e, file=sys.stderr)
+        sys.exit(1)
+    conn.autocommit = False
+    return conn
+
 #//****************** MAIN CLI MENUS (match-case) **********************??
 
 def product_menu(conn):
@@ -132,5 +152,55 @@ def main():
     finally:
         conn.close()
 
+# //************************ COMMAND LINE *************************//
+
+# one-shot lookups: subcommand -> (modules function, positional argument or None)
+LOOKUPS = {
+    "search": (modules.search_products, "name"),
+    "category": (modules.filter_by_category, "category"),
+    "product": (modules.product_details, "productid"),
+    "low-stock": (modules.low_stock_alerts, None),
+    "customer": (modules.view_customer_profile, "customerid"),
+    "orders": (modules.view_all_orders, None),
+    "order": (modules.view_order_details, "orderid"),
+    "customer-reviews": (modules.view_own_reviews, "customerid"),
+    "product-reviews": (modules.view_product_reviews, "productid"),
+    "ratings": (modules.view_average_rating, None),
+}
+
+def cli(argv=None):
+    parser = argparse.ArgumentParser(description="E-commerce database CLI.")
+    parser.add_argument("--host")
+    parser.add_argument("--port")
+    parser.add_argument("--dbname")
+    parser.add_argument("--user", help="password comes from PGPASSWORD")
+    sub = parser.add_subparsers(dest="command")
+
+    sub.add_parser("menu", help="interactive menus (default)")
+    for name, (func, arg) in LOOKUPS.items():
+        p = sub.add_parser(name, help=func.__name__.replace("_", " "))
+        if arg:
+            p.add_argument(arg)
+    sub.choices["low-stock"].add_argument("--threshold", type=int, default=50)
+
+    args = parser.parse_args(argv)
+
+    match args.command:
+        case None | "menu":
+            main()
+        case _:
+            func, arg = LOOKUPS[args.command]
+            conn = connect(args.host, args.port, args.dbname, args.user)
+            try:
+                if args.command == "low-stock":
+                    func(conn, args.threshold)
+                elif arg:
+                    func(conn, getattr(args, arg))
+                else:
+                    func(conn)
+            finally:
+                conn.close()
+    return 0
+
 if __name__ == "__main__":
-    main()
+    sys.exit(cli())
@@ -1,8 +1,8 @@
-from psycopg2 import Error
-
 # //**** HELPER ******//
 
 def q(conn, query, params=None, fetchone=False, fetchall=False):
+    # imported here so loading this module (e.g. for `db_main.py --help`) stays cheap
+    from psycopg2 import Error
     try:
         with conn.cursor() as cur:
             cur.execute(query, params or ())
@@ -14,8 +14,8 @@ def q(conn, query, params=None, fetchone=False, fetchall=False):
         return None
 
 #//**************** PRODUCT MANAGEMENT *****************//
-def search_products(conn):
-    name = input("Name search: ").strip().lower()
+def search_products(conn, name=None):
+    name = (name if name is not None else input("Name search: ")).strip().lower()
     rows = q(conn,
         """
         SELECT * FROM products
@@ -27,8 +27,8 @@ def search_products(conn):
     for r in rows or []:
         print(r)
 
-def filter_by_category(conn):
-    cat = input("Category: ").strip().lower()
+def filter_by_category(conn, cat=None):
+    cat = (cat if cat is not None else input("Category: ")).strip().lower()
     rows = q(conn,
         """
         SELECT *
@@ -42,8 +42,8 @@ def filter_by_category(conn):
     for r in rows or []:
         print(r)
 
-def product_details(conn):
-    productid = input("Product ID: ")
+def product_details(conn, productid=None):
+    productid = productid if productid is not None else input("Product ID: ")
     row = q(conn,
         """
         SELECT * FROM products
@@ -54,8 +54,7 @@ def product_details(conn):
     )
     print(row or "Not found.")
 
-def low_stock_alerts(conn):
-    threshold = 50  
+def low_stock_alerts(conn, threshold=50):
     rows = q(conn,
         "SELECT * FROM getrestockalerts(%s);",
         (threshold,),
@@ -178,8 +177,8 @@ def update_customer_info(conn):
     except:
         conn.rollback()
 
-def view_customer_profile(conn):
-    customerid = input("Customer ID: ")
+def view_customer_profile(conn, customerid=None):
+    customerid = customerid if customerid is not None else input("Customer ID: ")
     row = q(conn,
         """
         SELECT *
@@ -299,8 +298,8 @@ def view_all_orders(conn):
     for r in rows or []:
         print(r)
 
-def view_order_details(conn):
-    oid = input("Order ID: ")
+def view_order_details(conn, oid=None):
+    oid = oid if oid is not None else input("Order ID: ")
     order = q(conn,
         "SELECT * FROM orders WHERE orderid=%s;",
         (oid,),
@@ -352,8 +351,8 @@ def write_review(conn):
     except:
         conn.rollback()
 
-def view_own_reviews(conn):
-    cid = input("Customer ID: ")
+def view_own_reviews(conn, cid=None):
+    cid = cid if cid is not None else input("Customer ID: ")
     rows = q(conn,
         "SELECT * FROM reviews WHERE customerid=%s;",
         (cid,),
@@ -362,8 +361,8 @@ def view_own_reviews(conn):
     for r in rows or []:
         print(r)
 
-def view_product_reviews(conn):
-    productid = input("Product ID: ")
+def view_product_reviews(conn, productid=None):
+    productid = productid if productid is not None else input("Product ID: ")
     rows = q(conn,
         """
         SELECT r.reviewid,c.firstname,c.lastname,r.rating,r.reviewtext,r.reviewdate
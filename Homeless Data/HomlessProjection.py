@@ -1,135 +1,169 @@
 # --- Import libraries ---
-import pandas as pd
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+# Only the standard library is imported up front.  pandas, NumPy and plotly
+# are imported inside the functions that need them, so `--help`, `project`
+# or a single `figure` don't pay for everything at startup.
+import argparse
+import sys
+
+# --- Report settings ---
+DATA_FILE = "HomlessData.csv"
+REPORT_FILE = "Homeless_Report.html"
+OFFLINE_REPORT = False        # True inlines plotly.js so the report opens without internet
+MAX_POINTS_PER_TRACE = 2000   # longer line traces are downsampled (LTTB) before writing
+TABLE_PAGE_SIZE = 25          # longer tables become a paginated HTML table + summary
+
 
 # --- Read and clean data ---
-data = pd.read_csv("HomlessData.csv")
-data.columns = data.columns.str.strip()
-
-# Clean numeric data
-for col in ['Total Population']:
-    data[col] = (
-        data[col]
-        .astype(str)
-        .str.replace('"', '')
-        .str.replace(',', '')
-        .astype(float)
-    )
+def load_data(path=DATA_FILE):
+    # Streamed in chunks with declared dtypes, so large extracts fit in memory too
+    from ingest import read_yearly
 
-# --- Compute homeless rate ---
+    data = read_yearly(path)
+    return data.sort_values(by='Year')
 
-data = data.sort_values(by='Year')
 
 # ==================================================
 # 1️⃣ Table Figure
 # ==================================================
-table_fig = go.Figure(
-    data=[
-        go.Table(
-            header=dict(
-                values=list(data.columns),
-                fill_color='rgb(48, 84, 150)',
-                font=dict(color='white', size=14),
-                align='center'
-            ),
-            cells=dict(
-                values=[data[col] for col in data.columns],
-                fill_color='rgb(240, 240, 255)',
-                align='center',
-                font=dict(size=12)
+def make_table_figure(data, page_size=TABLE_PAGE_SIZE):
+    # Small tables keep the plotly Table; large ones would embed every cell as JSON
+    if len(data) > page_size:
+        from report_tools import paged_table_html
+        return paged_table_html(data, 'data-table', page_size=page_size)
+
+    import plotly.graph_objects as go
+
+    table_fig = go.Figure(
+        data=[
+            go.Table(
+                header=dict(
+                    values=list(data.columns),
+                    fill_color='rgb(48, 84, 150)',
+                    font=dict(color='white', size=14),
+                    align='center'
+                ),
+                cells=dict(
+                    values=[data[col] for col in data.columns],
+                    fill_color='rgb(240, 240, 255)',
+                    align='center',
+                    font=dict(size=12)
+                )
             )
-        )
-    ]
-)
-table_fig.update_layout(
-    title=dict(text="U.S. Homelessness Data (2010–2025)", x=0.5, font=dict(size=22))
-)
+        ]
+    )
+    table_fig.update_layout(
+        title=dict(text="U.S. Homelessness Data (2010–2025)", x=0.5, font=dict(size=22))
+    )
+    return table_fig
+
 
 # ==================================================
 # 2️⃣ Line Plot: Year vs Homeless Population
 # ==================================================
-fig_population = px.line(
-    data,
-    x='Year',
-    y='Homeless Population',
-    title='U.S. Homeless Population Over Time',
-    markers=True,
-    line_shape='spline',
-    color_discrete_sequence=['#0077b6']
-)
-fig_population.update_layout(title_x=0.5, template='plotly_white')
+def make_population_figure(data):
+    import plotly.express as px
+
+    fig_population = px.line(
+        data,
+        x='Year',
+        y='Homeless Population',
+        title='U.S. Homeless Population Over Time',
+        markers=True,
+        line_shape='spline',
+        color_discrete_sequence=['#0077b6']
+    )
+    fig_population.update_layout(title_x=0.5, template='plotly_white')
+    return fig_population
+
 
 # ==================================================
 # 3️⃣ Line Plot: Year vs Homeless Rate (%)
 # ==================================================
-fig_rate = px.line(
-    data,
-    x='Year',
-    y='Percent (%)',
-    title='U.S. Homeless Rate (% of Total Population)',
-    markers=True,
-    line_shape='spline',
-    color_discrete_sequence=['#e63946']
-)
-fig_rate.update_layout(title_x=0.5, template='plotly_white')
+def make_rate_figure(data):
+    import plotly.express as px
+
+    fig_rate = px.line(
+        data,
+        x='Year',
+        y='Percent (%)',
+        title='U.S. Homeless Rate (% of Total Population)',
+        markers=True,
+        line_shape='spline',
+        color_discrete_sequence=['#e63946']
+    )
+    fig_rate.update_layout(title_x=0.5, template='plotly_white')
+    return fig_rate
+
 
 # ==================================================
-# 🔮 Projected Homeless Population (2026–2030) — Polynomial Curve Fit
+# 🔮 Projected Homeless Population (2026–2030) — Best Model by Cross-Validation
 # ==================================================
+def project(data, horizon_end=2030):
+    # Score polynomial, log-linear and exponential smoothing models with
+    # rolling-origin cross-validation and keep the best one
+    from projection_engine import fit_projections
+
+    return fit_projections(data, 'Homeless Population', horizon_end=horizon_end)
+
+
+def make_projection_figure(data, projection=None):
+    import plotly.graph_objects as go
+
+    projection = projection or project(data)
+    best = projection['best'].iloc[0]
+    forecast = projection['forecast']
+
+    year_range = forecast['Year'].to_numpy()
+    fitted_values = forecast['predicted'].to_numpy()
+    future_mask = forecast['projected'].to_numpy()
+
+    # Create projection plot
+    fig_projection = go.Figure()
+
+    # Actual data
+    fig_projection.add_trace(go.Scatter(
+        x=data['Year'],
+        y=data['Homeless Population'],
+        mode='lines+markers',
+        name='Actual Data',
+        line=dict(color='#2a9d8f', width=3)
+    ))
 
-# Fit a 2nd-degree polynomial to capture curve trends
-coeffs = np.polyfit(data['Year'], data['Homeless Population'], deg=2)
-poly = np.poly1d(coeffs)
-
-# Generate smooth curve up to 2030
-year_range = np.arange(data['Year'].min(), 2031)
-fitted_values = poly(year_range)
-
-# Identify last known year for separation
-last_year = data['Year'].max()
-future_mask = year_range > last_year
-
-# Create projection plot
-fig_projection = go.Figure()
-
-# Actual data
-fig_projection.add_trace(go.Scatter(
-    x=data['Year'],
-    y=data['Homeless Population'],
-    mode='lines+markers',
-    name='Actual Data',
-    line=dict(color='#2a9d8f', width=3)
-))
-
-# Historical trend (fitted curve)
-fig_projection.add_trace(go.Scatter(
-    x=year_range[~future_mask],
-    y=fitted_values[~future_mask],
-    mode='lines',
-    name='Trend Fit',
-    line=dict(color='#264653', width=2, dash='dot')
-))
-
-# Future projection (2026–2030)
-fig_projection.add_trace(go.Scatter(
-    x=year_range[future_mask],
-    y=fitted_values[future_mask],
-    mode='lines+markers',
-    name='Projected (2026–2030)',
-    line=dict(color='#f4a261', width=3, dash='dash')
-))
-
-fig_projection.update_layout(
-    title="Projected U.S. Homeless Population (2026–2030, Polynomial Trend)",
-    xaxis_title="Year",
-    yaxis_title="Homeless Population",
-    template='plotly_white',
-    title_x=0.5,
-    legend=dict(bgcolor='rgba(255,255,255,0.8)')
-)
+    # Historical trend (fitted curve)
+    fig_projection.add_trace(go.Scatter(
+        x=year_range[~future_mask],
+        y=fitted_values[~future_mask],
+        mode='lines',
+        name='Trend Fit',
+        line=dict(color='#264653', width=2, dash='dot')
+    ))
 
+    # Future projection (2026–2030)
+    fig_projection.add_trace(go.Scatter(
+        x=year_range[future_mask],
+        y=fitted_values[future_mask],
+        mode='lines+markers',
+        name='Projected (2026–2030)',
+        line=dict(color='#f4a261', width=3, dash='dash')
+    ))
+
+    fig_projection.update_layout(
+        title=f"Projected U.S. Homeless Population (2026–2030, {best['model']} trend, CV RMSE {best['rmse']:,.0f})",
+        xaxis_title="Year",
+        yaxis_title="Homeless Population",
+        template='plotly_white',
+        title_x=0.5,
+        legend=dict(bgcolor='rgba(255,255,255,0.8)')
+    )
+    return fig_projection
+
+
+FIGURES = {
+    'table': make_table_figure,
+    'population': make_population_figure,
+    'rate': make_rate_figure,
+    'projection': make_projection_figure,
+}
 
 
 # ==================================================
@@ -185,6 +219,9 @@ html_header = """
     <h1>📊 U.S. Homelessness Analysis (2010–2030)</h1>
     <p>Trends, Rates, and Future Projections</p>
 </header>
+"""
+
+html_section1 = """
 <section>
     <h2>1. Original Data Table</h2>
 """
@@ -216,18 +253,84 @@ html_footer = """
 </html>
 """
 
+
 # ==================================================
 # 6️⃣ Write everything to an HTML file
 # ==================================================
-with open("Homeless_Report.html", "w", encoding="utf-8") as f:
-    f.write(html_header)
-    f.write(table_fig.to_html(full_html=False, include_plotlyjs='cdn'))
-    f.write(html_middle)
-    f.write(fig_population.to_html(full_html=False, include_plotlyjs=False))
-    f.write(html_middle2)
-    f.write(fig_rate.to_html(full_html=False, include_plotlyjs=False))
-    f.write(html_middle3)
-    f.write(fig_projection.to_html(full_html=False, include_plotlyjs=False))
-    f.write(html_footer)
-
-print("report generated: Homeless_Report.html — open it in your browser!")
+def build_report(data_file=DATA_FILE, out=REPORT_FILE, offline=OFFLINE_REPORT,
+                 max_points=MAX_POINTS_PER_TRACE, page_size=TABLE_PAGE_SIZE):
+    from report_tools import write_report
+
+    data = load_data(data_file)
+    sections = [
+        (html_section1, make_table_figure(data, page_size)),
+        (html_middle, make_population_figure(data)),
+    ]
+    # No rate without a population that could be rolled up (see ingest.stream_yearly)
+    if 'Percent (%)' in data:
+        sections.append((html_middle2, make_rate_figure(data)))
+    sections.append((html_middle3, make_projection_figure(data)))
+
+    return write_report(
+        out,
+        html_header,
+        html_footer,
+        sections,
+        offline=offline,
+        max_points=max_points,
+    )
+
+
+# ==================================================
+# Command line
+# ==================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="U.S. homelessness report builder.")
+    sub = parser.add_subparsers(dest="command")
+
+    report = sub.add_parser("report", help="build the full HTML report (default)")
+    report.add_argument("--csv", default=DATA_FILE)
+    report.add_argument("--out", default=REPORT_FILE)
+    report.add_argument("--offline", action="store_true", default=OFFLINE_REPORT,
+                        help="inline plotly.js so the report works without internet")
+    report.add_argument("--max-points", type=int, default=MAX_POINTS_PER_TRACE)
+    report.add_argument("--page-size", type=int, default=TABLE_PAGE_SIZE)
+
+    figure = sub.add_parser("figure", help="regenerate a single figure as its own HTML file")
+    figure.add_argument("name", choices=FIGURES)
+    figure.add_argument("--csv", default=DATA_FILE)
+    figure.add_argument("--out", default=None, help="default: <name>.html")
+
+    proj = sub.add_parser("project", help="print the best model and projected values")
+    proj.add_argument("--csv", default=DATA_FILE)
+    proj.add_argument("--horizon", type=int, default=2030)
+
+    args = parser.parse_args(argv)
+
+    match args.command:
+        case None:
+            build_report()
+        case "report":
+            build_report(args.csv, args.out, args.offline, args.max_points, args.page_size)
+        case "figure":
+            data = load_data(args.csv)
+            if args.name == "rate" and 'Percent (%)' not in data:
+                parser.error(f"{args.csv} has no usable 'Total Population' column, so there is no rate to plot")
+            fig = FIGURES[args.name](data)
+            out = args.out or f"{args.name}.html"
+            if isinstance(fig, str):
+                with open(out, "w", encoding="utf-8") as f:
+                    f.write(fig)
+            else:
+                fig.write_html(out, include_plotlyjs='cdn')
+            print(f"figure written: {out}")
+        case "project":
+            result = project(load_data(args.csv), args.horizon)
+            print(result['best'].to_string(index=False))
+            forecast = result['forecast']
+            print(forecast.loc[forecast['projected'], ['Year', 'predicted']].to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
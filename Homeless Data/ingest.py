@@ -0,0 +1,132 @@
+# --- Import libraries ---
+import warnings
+
+import pandas as pd
+
+# ==================================================
+# Chunked streaming ingestion
+# ==================================================
+# Point-in-time extracts can have tens of millions of per-shelter, per-night
+# rows.  Instead of loading the whole file, read it chunk by chunk with
+# declared dtypes, reduce each chunk to (region, year[, night]) totals and fold
+# them into small running accumulators.  Peak memory is one chunk plus the
+# accumulators, whatever the size of the file.
+
+CHUNK_ROWS = 1_000_000
+
+
+def _header(path):
+    # Raw header names (the national CSV has stray whitespace around them)
+    raw = pd.read_csv(path, nrows=0).columns
+    return {name.strip(): name for name in raw}
+
+
+def _fold(acc, part, keys, how):
+    # Merge one chunk's partial aggregate into the running one
+    if acc is None:
+        return part
+    return pd.concat([acc, part]).groupby(keys, observed=True, sort=False).agg(how)
+
+
+def stream_yearly(path, count_col='Homeless Population', population_col='Total Population',
+                  year_col='Year', date_col=None, region_cols=None, nightly='max',
+                  population_keys=None, chunksize=CHUNK_ROWS, dtype=None):
+    """Aggregate a (possibly huge) CSV to one row per year and region.
+
+    Yearly files are summed per (region, year).  When date_col is given the
+    rows are per night: counts are first summed across shelters for each
+    night, then the nightly totals are reduced per year with `nightly`
+    ('max', 'mean' or 'sum').
+
+    The population column, if present, is repeated on every row of the unit it
+    describes.  It takes the max per (population_keys, year), then is summed up
+    to (region_cols, year).  Pass population_keys when the rows are finer than
+    region_cols, e.g. population_keys=['State'] to roll states up to a national
+    year.  Without it the population is assumed to be per region; if it varies
+    within a region-year it can't be summed correctly, so it is dropped with a
+    warning.
+    Returns region_cols + [year_col, population_col?, count_col].
+    """
+    region_cols = list(region_cols or [])
+    header = _header(path)
+    has_population = population_col in header
+    unit_cols = [c for c in (population_keys or []) if c not in region_cols] if has_population else []
+    for col in region_cols + unit_cols + [count_col] + ([date_col] if date_col else [year_col]):
+        if col not in header:
+            raise KeyError(f"{col!r} not found in {path}")
+
+    wanted = region_cols + unit_cols + [count_col] + ([population_col] if has_population else [])
+    wanted += [date_col] if date_col else [year_col]
+    dtypes = {col: 'category' for col in region_cols + unit_cols}
+    dtypes[count_col] = 'float64'
+    if has_population:
+        dtypes[population_col] = 'float64'
+    if not date_col:
+        dtypes[year_col] = 'int16'
+    dtypes.update(dtype or {})
+
+    keys = region_cols + [year_col]
+    count_keys = keys + ([date_col] if date_col else [])
+    pop_keys = keys + unit_cols
+    counts = None
+    population = None
+
+    reader = pd.read_csv(
+        path,
+        usecols=[header[col] for col in wanted],
+        dtype={header[col]: t for col, t in dtypes.items() if col in header},
+        thousands=',',
+        chunksize=chunksize,
+    )
+    for chunk in reader:
+        chunk.columns = chunk.columns.str.strip()
+        if date_col:
+            nights = pd.to_datetime(chunk[date_col])
+            chunk[year_col] = nights.dt.year.astype('int16')
+            chunk[date_col] = nights.dt.normalize()
+
+        part = chunk.groupby(count_keys, observed=True, sort=False)[count_col].sum(min_count=1)
+        counts = _fold(counts, part, count_keys, 'sum')
+        if has_population:
+            # min and max per unit: if they differ the unit is too coarse
+            part = chunk.groupby(pop_keys, observed=True, sort=False)[population_col].agg(['min', 'max'])
+            population = _fold(population, part, pop_keys, {'min': 'min', 'max': 'max'})
+
+    if counts is None:
+        raise ValueError(f"{path} has no data rows")
+    if date_col:
+        counts = counts.groupby(keys, observed=True, sort=False).agg(nightly)
+
+    result = counts.to_frame(count_col)
+    if has_population:
+        if (population['min'].ne(population['max']) & population['max'].notna()).any():
+            warnings.warn(
+                f"{population_col!r} varies within {pop_keys}; pass population_keys naming the "
+                f"unit it is given for. Dropping it instead of summing it wrongly."
+            )
+        else:
+            population = population['max']
+            if unit_cols:
+                population = population.groupby(level=keys, observed=True, sort=False).sum(min_count=1)
+            result = population.to_frame(population_col).join(result, how='outer')
+    result = result.reset_index().sort_values(keys, ignore_index=True)
+    for col in region_cols:
+        result[col] = result[col].astype(str)
+    return result
+
+
+def read_yearly(path, count_col='Homeless Population', population_col='Total Population',
+                year_col='Year', **kwargs):
+    """Stream path into the cleaned frame HomlessProjection.py works with.
+
+    Columns: [regions...,] Year, Total Population, Homeless Population,
+    Percent (%) - Total Population and Percent (%) only when the file has a
+    population column that can be rolled up (see stream_yearly).
+    """
+    data = stream_yearly(path, count_col, population_col, year_col, **kwargs)
+    data[year_col] = data[year_col].astype('int64')
+    if data[count_col].notna().all() and (data[count_col] % 1 == 0).all():
+        data[count_col] = data[count_col].astype('int64')
+    if population_col in data:
+        data['Percent (%)'] = data[count_col] / data[population_col] * 100
+    return data
@@ -0,0 +1,332 @@
+# --- Import libraries ---
+import numpy as np
+import pandas as pd
+
+# ==================================================
+# Candidate models
+# ==================================================
+# Every model is fitted to ALL series at once: the series are stacked into a
+# (series x years) matrix and each fit is a batch of small linear solves.
+#   ('poly', d)          -> polynomial of degree d in (scaled) year
+#   ('loglinear', 1)     -> straight line on log(value), i.e. constant growth
+#   ('holt', (a, b))     -> Holt's linear exponential smoothing, level a / trend b
+DEFAULT_MODELS = {
+    'poly1': ('poly', 1),
+    'poly2': ('poly', 2),
+    'poly3': ('poly', 3),
+    'loglinear': ('loglinear', 1),
+    'holt_a0.3_b0.1': ('holt', (0.3, 0.1)),
+    'holt_a0.6_b0.1': ('holt', (0.6, 0.1)),
+    'holt_a0.6_b0.3': ('holt', (0.6, 0.3)),
+    'holt_a0.9_b0.3': ('holt', (0.9, 0.3)),
+}
+
+METRICS = ('rmse', 'mae', 'mape')
+
+# Small ridge term so series with too few points still give a solvable system
+_RIDGE = 1e-9
+
+
+# ==================================================
+# Stacking long-format data into a matrix
+# ==================================================
+def stack_series(data, value_col, time_col='Year', group_cols=None):
+    """Pivot a long frame into (keys, years, Y) with one row of Y per series.
+
+    Years are reindexed to a complete integer range so gaps show up as NaN.
+    Without group_cols the whole frame is treated as a single series.
+    """
+    group_cols = list(group_cols or [])
+    df = data[group_cols + [time_col, value_col]].dropna(subset=[time_col])
+    df = df.astype({time_col: int})
+
+    if group_cols:
+        wide = (
+            df.groupby(group_cols + [time_col])[value_col]
+            .sum(min_count=1)
+            .unstack(time_col)
+        )
+    else:
+        series = df.groupby(time_col)[value_col].sum(min_count=1)
+        wide = series.to_frame('All').T
+        wide.index.name = 'Series'
+
+    years = np.arange(wide.columns.min(), wide.columns.max() + 1)
+    wide = wide.reindex(columns=years)
+    return wide.index, years, wide.to_numpy(dtype=float)
+
+
+# ==================================================
+# Batched fitting helpers
+# ==================================================
+def _scale(years):
+    # Centre and scale the years so high polynomial degrees stay well conditioned
+    center = years.mean()
+    half_range = max((years.max() - years.min()) / 2.0, 1.0)
+    return lambda y: (np.asarray(y, dtype=float) - center) / half_range
+
+
+def _weighted_lstsq(X, Y, W):
+    """Solve one weighted least-squares problem per leading index of Y.
+
+    X is (T, p), Y and W are (..., T); returns coefficients (..., p).
+    """
+    Yz = np.where(W > 0, Y, 0.0)
+    A = np.einsum('...t,tp,tq->...pq', W, X, X)
+    b = np.einsum('...t,tp,...t->...p', W, X, Yz)
+    A = A + _RIDGE * np.eye(X.shape[1])
+    return np.linalg.solve(A, b[..., None])[..., 0]
+
+
+def _regression_predict(kind, degree, t, Y, W, t_out):
+    """Fit poly/loglinear models under weights W and predict at t_out."""
+    if kind == 'loglinear':
+        positive = np.isfinite(Y) & (Y > 0)
+        Y = np.log(np.where(positive, Y, 1.0))
+        W = W * positive
+    X = np.vander(t, degree + 1, increasing=True)
+    X_out = np.vander(t_out, degree + 1, increasing=True)
+    coef = _weighted_lstsq(X, Y, W)
+    pred = np.einsum('tp,...p->...t', X_out, coef)
+    if kind == 'loglinear':
+        pred = np.exp(pred)
+    return pred
+
+
+def _holt_states(Y, alpha, beta):
+    """Run Holt smoothing over time for all series at once.
+
+    Returns level and trend arrays (S, T) holding the state after each year.
+    Missing years just carry the previous forecast forward.  The loop is over
+    years, never over series.
+    """
+    S, T = Y.shape
+    level = np.full((S, T), np.nan)
+    trend = np.full((S, T), np.nan)
+    lvl = np.full(S, np.nan)
+    trd = np.full(S, np.nan)
+    first_value = np.full(S, np.nan)
+    first_t = np.full(S, np.nan)
+
+    for t in range(T):
+        y = Y[:, t]
+        obs = np.isfinite(y)
+        started = np.isfinite(first_value)
+        has_trend = np.isfinite(trd)
+
+        forecast = lvl + np.where(has_trend, trd, 0.0)
+        smoothed = alpha * y + (1 - alpha) * forecast
+
+        # first observation: level only; second: initial trend from the two points
+        is_first = obs & ~started
+        is_second = obs & started & ~has_trend
+        is_update = obs & has_trend
+
+        new_lvl = np.where(is_first, y, forecast)
+        new_lvl = np.where(is_second, y, new_lvl)
+        new_lvl = np.where(is_update, smoothed, new_lvl)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            init_trend = (y - first_value) / (t - first_t)
+        new_trd = np.where(is_second, init_trend, trd)
+        new_trd = np.where(is_update, beta * (new_lvl - lvl) + (1 - beta) * trd, new_trd)
+
+        first_value = np.where(is_first, y, first_value)
+        first_t = np.where(is_first, t, first_t)
+        lvl, trd = new_lvl, new_trd
+        level[:, t] = lvl
+        trend[:, t] = np.where(np.isfinite(trd), trd, 0.0)
+
+    return level, trend
+
+
+def _holt_forecast(level, trend, origin_idx, t_idx):
+    """Forecast every t_idx from the state at origin_idx (one per origin)."""
+    steps = t_idx[None, :] - origin_idx[:, None]          # (O, T)
+    lvl = level[:, origin_idx].T[:, :, None]             # (O, S, 1)
+    trd = trend[:, origin_idx].T[:, :, None]
+    return lvl + steps[:, None, :] * trd
+
+
+# ==================================================
+# Rolling-origin cross-validation
+# ==================================================
+def _error_metrics(pred, Y, test):
+    """Aggregate forecast errors over origins/horizons -> dict of (S,) arrays."""
+    err = np.where(test, pred - Y, 0.0)
+    n = test.sum(axis=(0, 2))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mae = np.abs(err).sum(axis=(0, 2)) / n
+        rmse = np.sqrt((err ** 2).sum(axis=(0, 2)) / n)
+        pct_mask = test & (Y != 0)
+        pct = np.where(pct_mask, np.abs(err) / np.abs(np.where(pct_mask, Y, 1.0)), 0.0)
+        mape = 100.0 * pct.sum(axis=(0, 2)) / pct_mask.sum(axis=(0, 2))
+    return {'rmse': rmse, 'mae': mae, 'mape': mape, 'n_forecasts': n}
+
+
+def cross_validate(years, Y, models=None, min_train=5, cv_horizon=3):
+    """Score every model on every series with rolling-origin CV.
+
+    For each origin k the model is fitted on the first k years and forecasts
+    the next cv_horizon years.  An origin only counts for a series once that
+    series has at least min_train observed training points, and every model
+    is scored on that same set of forecasts.  A model that can't be fitted
+    at one of those origins gets NaN scores for the series, so the remaining
+    models are always compared like for like.
+    All origins and series are solved together.
+    Returns {model_name: {metric: (S,) array}}.
+    """
+    models = models or DEFAULT_MODELS
+    scale = _scale(years)
+    t = scale(years)
+    T = len(years)
+    obs = np.isfinite(Y)
+
+    origins = np.arange(1, max(T, 1))                     # training lengths
+    t_idx = np.arange(T)
+    train = (t_idx[None, :] < origins[:, None])          # (O, T)
+    ahead = (t_idx[None, :] >= origins[:, None]) & (t_idx[None, :] < origins[:, None] + cv_horizon)
+    W = (train[:, None, :] & obs[None]).astype(float)    # (O, S, T)
+    # one evaluation mask per series, shared by every model
+    origin_ok = W.sum(axis=-1) >= min_train               # (O, S)
+    test = ahead[:, None, :] & obs[None] & origin_ok[..., None]
+
+    scores = {}
+    holt_cache = {}
+    for name, (kind, param) in models.items():
+        if kind in ('poly', 'loglinear'):
+            pred = _regression_predict(kind, param, t, Y, W, t)
+            # enough points to pin down the fit (loglinear only uses the positive ones)
+            W_used = W * (obs & (Y > 0)) if kind == 'loglinear' else W
+            fitted = W_used.sum(axis=-1) >= param + 1
+        elif kind == 'holt':
+            if param not in holt_cache:
+                holt_cache[param] = _holt_states(Y, *param)
+            level, trend = holt_cache[param]
+            pred = _holt_forecast(level, trend, origins - 1, t_idx)
+            fitted = np.isfinite(level[:, origins - 1]).T
+        else:
+            raise ValueError(f"Unknown model kind: {kind}")
+
+        usable = (fitted | ~origin_ok).all(axis=0)       # fits at every shared origin
+        metrics = _error_metrics(pred, Y, test & usable[None, :, None])
+        for col in METRICS:
+            metrics[col] = np.where(usable, metrics[col], np.nan)
+        scores[name] = metrics
+    return scores
+
+
+# ==================================================
+# Full-data fit + projection
+# ==================================================
+def _project(kind, param, years, Y, out_years):
+    scale = _scale(years)
+    obs = np.isfinite(Y)
+    if kind in ('poly', 'loglinear'):
+        return _regression_predict(kind, param, scale(years), Y, obs.astype(float), scale(out_years))
+
+    level, trend = _holt_states(Y, *param)
+    T = len(years)
+    out_idx = np.asarray(out_years) - years[0]
+    # in-sample: one-step-ahead forecasts; beyond the data: extend from the last state
+    inside = np.clip(out_idx - 1, 0, T - 1)
+    pred = level[:, inside] + trend[:, inside]
+    # no state before a series' first observation: seed with that value
+    seen = np.isfinite(Y)
+    first_idx = seen.argmax(axis=1)
+    first_value = Y[np.arange(len(Y)), first_idx]
+    before = out_idx[None, :] <= first_idx[:, None]
+    pred = np.where(before, first_value[:, None], pred)
+    future = out_idx >= T
+    steps = out_idx[future] - (T - 1)
+    pred[:, future] = level[:, [-1]] + steps[None, :] * trend[:, [-1]]
+    return pred
+
+
+def fit_projections(data, value_col, time_col='Year', group_cols=None, models=None,
+                    horizon_end=2030, min_train=5, cv_horizon=3, metric='rmse'):
+    """Pick the best model per series by rolling-origin CV and project it forward.
+
+    Returns a dict of DataFrames:
+        'scores'   - one row per (series, model) with CV error metrics
+        'best'     - the winning model per series with its metrics
+        'forecast' - actual / predicted values per series and year up to horizon_end
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}")
+    models = models or DEFAULT_MODELS
+    group_cols = list(group_cols or [])
+
+    keys, years, Y = stack_series(data, value_col, time_col, group_cols)
+    scores = cross_validate(years, Y, models, min_train, cv_horizon)
+    names = list(models)
+
+    # (S, M) table of the chosen metric; series with no usable origins fall back to the first model
+    table = np.column_stack([scores[name][metric] for name in names])
+    table = np.where(np.isfinite(table), table, np.inf)
+    best_idx = table.argmin(axis=1)
+
+    out_years = np.arange(years[0], max(horizon_end, years[-1]) + 1)
+    predicted = np.empty((len(keys), len(out_years)))
+    for m, name in enumerate(names):
+        rows = best_idx == m
+        if rows.any():
+            kind, param = models[name]
+            predicted[rows] = _project(kind, param, years, Y[rows], out_years)
+
+    key_frame = keys.to_frame(index=False)
+    label_cols = list(key_frame.columns)
+
+    score_frames = []
+    for name in names:
+        frame = key_frame.copy()
+        frame['model'] = name
+        for col, values in scores[name].items():
+            frame[col] = values
+        score_frames.append(frame)
+    score_df = pd.concat(score_frames, ignore_index=True)
+
+    best_df = key_frame.copy()
+    best_df['model'] = np.asarray(names)[best_idx]
+    for col in METRICS + ('n_forecasts',):
+        best_df[col] = np.column_stack([scores[name][col] for name in names])[np.arange(len(keys)), best_idx]
+
+    actual = np.full_like(predicted, np.nan)
+    actual[:, :len(years)] = Y
+    forecast_df = key_frame.loc[key_frame.index.repeat(len(out_years))].reset_index(drop=True)
+    forecast_df[time_col] = np.tile(out_years, len(keys))
+    forecast_df['actual'] = actual.ravel()
+    forecast_df['predicted'] = predicted.ravel()
+    forecast_df['projected'] = forecast_df[time_col] > years[-1]
+    forecast_df['model'] = np.repeat(best_df['model'].to_numpy(), len(out_years))
+
+    return {
+        'scores': score_df.sort_values(label_cols + [metric], ignore_index=True),
+        'best': best_df,
+        'forecast': forecast_df,
+    }
+
+
+# ==================================================
+# Command line: python projection_engine.py data.csv --value "Homeless Population"
+# ==================================================
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fit and project many series at once.")
+    parser.add_argument("csv", help="long-format CSV with one row per series and year")
+    parser.add_argument("--value", default="Homeless Population", help="column to project")
+    parser.add_argument("--time", default="Year", help="year column")
+    parser.add_argument("--group", nargs="*", default=[], help="columns identifying a series (e.g. State)")
+    parser.add_argument("--horizon", type=int, default=2030, help="last year to project")
+    parser.add_argument("--metric", choices=METRICS, default="rmse")
+    parser.add_argument("--out", default="projections.csv", help="where to write the forecast table")
+    args = parser.parse_args()
+
+    df = pd.read_csv(args.csv, thousands=",")
+    df.columns = df.columns.str.strip()
+    result = fit_projections(df, args.value, args.time, args.group,
+                             horizon_end=args.horizon, metric=args.metric)
+    result['forecast'].to_csv(args.out, index=False)
+    print(result['best'].to_string(index=False))
+    print(f"forecast written: {args.out}")
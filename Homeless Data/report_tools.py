@@ -0,0 +1,200 @@
+# --- Import libraries ---
+import html
+import os
+import time
+
+import numpy as np
+
+# ==================================================
+# Shape-preserving downsampling (Largest-Triangle-Three-Buckets)
+# ==================================================
+def lttb(x, y, threshold):
+    """Return the indices of the points LTTB keeps out of (x, y).
+
+    The first and last points are always kept; every bucket in between keeps
+    the point forming the largest triangle with its neighbours, so peaks and
+    dips survive while flat stretches are thinned out.
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    x = x.astype(float)
+
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    keep = np.empty(threshold, dtype=int)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    prev = 0
+    for b in range(threshold - 2):
+        start, stop = edges[b], edges[b + 1]
+        # average of the next bucket (the last point for the final bucket)
+        nxt_start, nxt_stop = edges[b + 1], edges[b + 2] if b + 2 < len(edges) else n
+        avg_x = x[nxt_start:nxt_stop].mean()
+        avg_y = np.nanmean(y[nxt_start:nxt_stop]) if np.isfinite(y[nxt_start:nxt_stop]).any() else y[prev]
+
+        area = np.abs(
+            (x[prev] - avg_x) * (y[start:stop] - y[prev])
+            - (x[prev] - x[start:stop]) * (avg_y - y[prev])
+        )
+        area = np.where(np.isfinite(area), area, -1.0)
+        prev = start + int(area.argmax())
+        keep[b + 1] = prev
+
+    return keep
+
+
+# per-point attributes that must be thinned together with x and y
+POINT_ATTRS = ('customdata', 'text', 'hovertext', 'ids', 'marker.color', 'marker.size', 'marker.symbol')
+
+
+def _is_monotonic(x):
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    step = np.diff(x.astype(float))
+    return bool((step >= 0).all() or (step <= 0).all())
+
+
+def downsample_figure(fig, max_points=2000):
+    """Thin every line trace with more than max_points points, in place.
+
+    Only traces drawn with lines and ordered by x are touched (LTTB assumes a
+    line); marker-only scatters are left alone.  Per-point attributes such as
+    customdata and hover text are sliced with the same indices.
+    """
+    for trace in fig.data:
+        if trace.type not in ('scatter', 'scattergl') or trace.x is None or trace.y is None:
+            continue
+        n = len(trace.y)
+        if n <= max_points or 'lines' not in (trace.mode or 'lines'):
+            continue
+        x = np.asarray(trace.x)
+        if not (np.issubdtype(x.dtype, np.number) or np.issubdtype(x.dtype, np.datetime64)):
+            continue
+        if len(x) != n or not _is_monotonic(x):
+            continue
+        idx = lttb(x, trace.y, max_points)
+        for attr in POINT_ATTRS:
+            value = trace[attr]
+            if value is not None and not isinstance(value, str) and np.ndim(value) > 0 and len(value) == n:
+                trace[attr] = np.asarray(value)[idx]
+        trace.x = x[idx]
+        trace.y = np.asarray(trace.y)[idx]
+    return fig
+
+
+# ==================================================
+# Paginated / summarized table
+# ==================================================
+PAGER_STYLE = """
+<style>
+    .paged-table table { border-collapse: collapse; width: 100%; font-size: 0.9em; }
+    .paged-table th { background: rgb(48, 84, 150); color: white; padding: 6px; }
+    .paged-table td { background: rgb(240, 240, 255); padding: 4px 6px; text-align: center; }
+    .paged-table .pager { margin-top: 10px; text-align: center; }
+    .paged-table .note { color: #555; font-size: 0.85em; }
+</style>
+"""
+
+
+def paged_table_html(df, table_id, page_size=25, max_rows=5000):
+    """Render df as an HTML table that shows one page at a time.
+
+    Rows are embedded once as compact JSON and drawn by a few lines of
+    JavaScript, instead of one plotly Table cell per value.  Tables with more
+    than one page also get a column summary of all rows; tables longer than
+    max_rows only embed the first max_rows rows.
+    """
+    shown = df.head(max_rows)
+    payload = shown.to_json(orient='values', double_precision=6).replace('</', '<\\/')
+    header = ''.join(f'<th>{html.escape(str(col))}</th>' for col in df.columns)
+
+    parts = [PAGER_STYLE, f'<div class="paged-table" id="{table_id}">']
+    if len(df) > page_size:
+        summary = df.describe().T.round(3)
+        parts.append('<p class="note">Summary of all rows:</p>')
+        parts.append(summary.to_html(border=0))
+    if len(df) > max_rows:
+        parts.append(f'<p class="note">Showing the first {max_rows:,} of {len(df):,} rows.</p>')
+    parts.append(f"""
+<table><thead><tr>{header}</tr></thead><tbody></tbody></table>
+<div class="pager">
+    <button data-step="-1">&lsaquo; Prev</button>
+    <span></span>
+    <button data-step="1">Next &rsaquo;</button>
+</div>
+<script>
+(function () {{
+    var rows = {payload};
+    var size = {int(page_size)}, page = 0;
+    var root = document.getElementById("{table_id}");
+    var body = root.querySelector("tbody"), label = root.querySelector(".pager span");
+    var pages = Math.max(1, Math.ceil(rows.length / size));
+    function draw() {{
+        var html = "";
+        rows.slice(page * size, (page + 1) * size).forEach(function (r) {{
+            html += "<tr>" + r.map(function (v) {{
+                return "<td>" + (v === null ? "" : String(v).replace(/&/g, "&amp;").replace(/</g, "&lt;")) + "</td>";
+            }}).join("") + "</tr>";
+        }});
+        body.innerHTML = html;
+        label.textContent = "Page " + (page + 1) + " of " + pages;
+    }}
+    root.querySelectorAll(".pager button").forEach(function (btn) {{
+        btn.addEventListener("click", function () {{
+            page = Math.min(pages - 1, Math.max(0, page + Number(btn.dataset.step)));
+            draw();
+        }});
+    }});
+    draw();
+}})();
+</script>
+</div>
+""")
+    return '\n'.join(parts)
+
+
+# ==================================================
+# Report writer
+# ==================================================
+def write_report(path, header, footer, sections, offline=False, max_points=2000):
+    """Write header, each (section_html, content) pair and footer to path.
+
+    content is either a plotly figure or a ready-made HTML string.  plotly.js
+    is included exactly once, with the first figure: inlined when offline=True
+    so the file works without a network, otherwise loaded from the CDN.
+    Prints a size/timing summary when done.
+    """
+    start = time.perf_counter()
+    sizes = []
+    plotlyjs_done = False
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(header)
+        for section_html, content in sections:
+            t0 = time.perf_counter()
+            if hasattr(content, 'to_html'):
+                downsample_figure(content, max_points)
+                include = False if plotlyjs_done else (True if offline else 'cdn')
+                chunk = content.to_html(full_html=False, include_plotlyjs=include)
+                plotlyjs_done = True
+            else:
+                chunk = content
+            f.write(section_html)
+            f.write(chunk)
+            sizes.append((section_html, len(chunk.encode('utf-8')), time.perf_counter() - t0))
+        f.write(footer)
+    total = os.path.getsize(path)
+
+    elapsed = time.perf_counter() - start
+    print(f"report generated: {path} — {total / 1024:,.0f} KB in {elapsed:.2f}s "
+          f"({'offline, plotly.js embedded' if offline else 'plotly.js from CDN'})")
+    for section_html, size, seconds in sizes:
+        title = section_html.split('<h2>')[-1].split('</h2>')[0].strip() if '<h2>' in section_html else 'section'
+        print(f"    {title:<45} {size / 1024:>9,.1f} KB  {seconds:6.2f}s")
+    return total
@@ -1,10 +1,268 @@
-import pandas as pd
-import numpy as ny
+# --- Import libraries ---
+import html
+import os
+import re
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from string import Template
 
-#create a header 
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
 
-#create a footer 
+from ingest import read_yearly
+from projection_engine import fit_projections
 
+SITE_DIR = "site"
+PLOTLY_JS = "plotly.min.js"   # written once, shared by every page (and the browser cache)
 
-with open("Index.html", "w", encoding = "utf=8") as file:
-    file.write("placeholder")
\ No newline at end of file
+# mkstemp creates files as 0600; published files get the normal umask-based mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+# ==================================================
+# Header / footer templates (built once per process)
+# ==================================================
+STYLE = """
+    body { font-family: 'Segoe UI', Roboto, sans-serif; margin: 0; background-color: #f9fafc; color: #222; }
+    header { background: linear-gradient(90deg, #023e8a, #0077b6); color: white; text-align: center;
+             padding: 40px 20px; box-shadow: 0 4px 8px rgba(0,0,0,0.2); }
+    header h1 { margin: 0; font-size: 2.2em; }
+    header p { font-size: 1.1em; margin-top: 10px; }
+    header a { color: #caf0f8; }
+    section { max-width: 1100px; margin: 40px auto; background: white; padding: 30px;
+              border-radius: 15px; box-shadow: 0 4px 12px rgba(0,0,0,0.1); }
+    h2 { border-left: 6px solid #0077b6; padding-left: 10px; color: #0077b6; font-size: 1.5em; }
+    table { border-collapse: collapse; width: 100%; }
+    th { background: rgb(48, 84, 150); color: white; padding: 8px; }
+    td { background: rgb(240, 240, 255); padding: 6px 8px; text-align: center; }
+"""
+
+#create a header
+@lru_cache(maxsize=None)
+def header_template():
+    return Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<meta name="viewport" content="width=device-width, initial-scale=1.0">
+<title>$title</title>
+<style>""" + STYLE + """</style>
+<script src="${root}""" + PLOTLY_JS + """"></script>
+</head>
+<body>
+<header>
+    <h1>$title</h1>
+    <p>$subtitle</p>
+</header>
+""")
+
+#create a footer
+@lru_cache(maxsize=None)
+def footer_template():
+    return Template("""
+<footer style="text-align:center; padding:20px; color:#555; font-size:0.9em;">
+    <p><a href="${root}index.html">All regions</a> · Generated $generated using Python, Pandas, NumPy, and Plotly</p>
+</footer>
+</body>
+</html>
+""")
+
+
+def render_page(title, subtitle, body, root="", generated=""):
+    values = dict(title=html.escape(title), subtitle=subtitle, root=root, generated=generated)
+    return header_template().substitute(values) + body + footer_template().substitute(values)
+
+
+# ==================================================
+# Helpers
+# ==================================================
+def slugify(key):
+    parts = key if isinstance(key, tuple) else (key,)
+    slug = re.sub(r'[^a-z0-9]+', '-', ' '.join(str(p) for p in parts).lower()).strip('-')
+    return slug or 'series'
+
+
+def write_atomic(path, text):
+    # Write to a temp file next to the target, then rename over it, so a reader
+    # (or a crashed build) never sees a half-written page
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        # keep the mode of the file being replaced, else the umask default
+        mode = os.stat(path).st_mode & 0o777 if os.path.exists(path) else FILE_MODE
+        os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return len(text.encode("utf-8"))
+
+
+# ==================================================
+# One page per region (runs in worker processes)
+# ==================================================
+@lru_cache(maxsize=None)
+def base_layout():
+    # Resolving the 'plotly_white' template is most of the cost of a figure, so
+    # do it once per worker and reuse the plain dict for every page
+    layout = go.Figure().update_layout(
+        xaxis_title="Year",
+        template='plotly_white',
+        title_x=0.5,
+        legend=dict(bgcolor='rgba(255,255,255,0.8)')
+    )
+    return layout.to_plotly_json()['layout']
+
+
+def projection_figure(name, value_col, years, actual, predicted, projected, model):
+    seen = ~np.isnan(actual)
+    data = [
+        dict(type='scatter', x=years[seen], y=actual[seen], mode='lines+markers', name='Actual Data',
+             line=dict(color='#2a9d8f', width=3)),
+        dict(type='scatter', x=years[~projected], y=predicted[~projected], mode='lines', name='Trend Fit',
+             line=dict(color='#264653', width=2, dash='dot')),
+        dict(type='scatter', x=years[projected], y=predicted[projected], mode='lines+markers', name='Projected',
+             line=dict(color='#f4a261', width=3, dash='dash')),
+    ]
+    layout = dict(base_layout())
+    layout['title'] = dict(layout.get('title', {}), text=f"{name}: {value_col} ({model} trend)")
+    layout['yaxis'] = dict(layout.get('yaxis', {}), title=dict(text=value_col))
+    return dict(data=data, layout=layout)
+
+
+def build_region_page(job):
+    """Render and write one region page; returns (slug, bytes written)."""
+    slug, name, value_col, years, actual, predicted, projected, stats, out_dir, generated = job
+    fig = projection_figure(name, value_col, years, actual, predicted, projected, stats['model'])
+
+    rows = ''.join(
+        f"<tr><td>{int(y)}</td><td>{'' if np.isnan(a) else f'{a:,.0f}'}</td>"
+        f"<td>{p:,.0f}</td><td>{'projected' if f else 'fitted'}</td></tr>"
+        for y, a, p, f in zip(years, actual, predicted, projected)
+    )
+    body = f"""
+<section>
+    <h2>Projection</h2>
+    {pio.to_html(fig, full_html=False, include_plotlyjs=False, validate=False)}
+    <p>Best model by rolling-origin cross-validation: <b>{stats['model']}</b>
+       (RMSE {stats['rmse']:,.0f}, MAE {stats['mae']:,.0f}, MAPE {stats['mape']:.2f}%)</p>
+</section>
+<section>
+    <h2>Data</h2>
+    <table><tr><th>Year</th><th>Actual</th><th>Model</th><th></th></tr>{rows}</table>
+</section>
+"""
+    page = render_page(name, f"{html.escape(value_col)} — trends and projections", body,
+                       root="../", generated=generated)
+    return slug, write_atomic(os.path.join(out_dir, "regions", f"{slug}.html"), page)
+
+
+# ==================================================
+# Site build
+# ==================================================
+def build_site(data, value_col='Homeless Population', group_cols=None, out_dir=SITE_DIR,
+               horizon_end=2030, workers=None):
+    start = time.perf_counter()
+    group_cols = list(group_cols or [])
+    os.makedirs(os.path.join(out_dir, "regions"), exist_ok=True)
+    generated = time.strftime("%Y-%m-%d %H:%M")
+
+    # plotly.js goes out once as its own file instead of into every page;
+    # rewritten whenever the installed plotly ships a different bundle
+    from plotly.offline import get_plotlyjs
+    plotly_js = get_plotlyjs()
+    plotly_path = os.path.join(out_dir, PLOTLY_JS)
+    current = None
+    if os.path.exists(plotly_path):
+        with open(plotly_path, encoding="utf-8") as f:
+            current = f.read()
+    if current != plotly_js:
+        write_atomic(plotly_path, plotly_js)
+
+    projection = fit_projections(data, value_col, group_cols=group_cols, horizon_end=horizon_end)
+    best = projection['best']
+    forecast = projection['forecast']
+    label_cols = [c for c in best.columns if c not in ('model', 'rmse', 'mae', 'mape', 'n_forecasts')]
+
+    jobs = []
+    index_rows = []
+    slugs = set()
+    n_years = len(forecast) // len(best)
+    for i, stats in enumerate(best.to_dict('records')):
+        part = forecast.iloc[i * n_years:(i + 1) * n_years]
+        key = tuple(stats[c] for c in label_cols)
+        name = ' / '.join(str(k) for k in key)
+        slug = slugify(key)
+        if slug in slugs:
+            slug = f"{slug}-{i}"
+        slugs.add(slug)
+        years = part['Year'].to_numpy()
+        actual = part['actual'].to_numpy()
+        predicted = part['predicted'].to_numpy()
+        projected = part['projected'].to_numpy()
+        jobs.append((slug, name, value_col, years, actual, predicted, projected, stats, out_dir, generated))
+
+        latest = actual[~np.isnan(actual)]
+        index_rows.append(
+            f"<tr><td><a href=\"regions/{slug}.html\">{html.escape(name)}</a></td>"
+            f"<td>{latest[-1] if len(latest) else np.nan:,.0f}</td><td>{predicted[-1]:,.0f}</td>"
+            f"<td>{stats['model']}</td><td>{stats['mape']:.2f}%</td></tr>"
+        )
+
+    # Figures are CPU-bound, so render pages across cores
+    sizes = []
+    if len(jobs) == 1 or workers == 1:
+        sizes = [build_region_page(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunk = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 4))
+            sizes = list(pool.map(build_region_page, jobs, chunksize=chunk))
+
+    # Regions that dropped out of the data would otherwise stay published, unlinked
+    regions_dir = os.path.join(out_dir, "regions")
+    for page in os.listdir(regions_dir):
+        if page.endswith(".html") and page[:-len(".html")] not in slugs:
+            os.remove(os.path.join(regions_dir, page))
+
+    body = f"""
+<section>
+    <h2>Regions</h2>
+    <table>
+        <tr><th>Region</th><th>Latest</th><th>Projected {horizon_end}</th><th>Model</th><th>CV MAPE</th></tr>
+        {''.join(index_rows)}
+    </table>
+</section>
+"""
+    index = render_page("U.S. Homelessness Projections", f"{len(jobs)} regions · {html.escape(value_col)}",
+                        body, generated=generated)
+    total = write_atomic(os.path.join(out_dir, "index.html"), index) + sum(size for _, size in sizes)
+
+    elapsed = time.perf_counter() - start
+    print(f"site generated: {out_dir}/index.html + {len(jobs)} pages — {total / 1024:,.0f} KB in {elapsed:.2f}s")
+    return len(jobs)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build the static projections website.")
+    parser.add_argument("csv", nargs="?", default="HomlessData.csv", help="long-format CSV, one row per region and year")
+    parser.add_argument("--value", default="Homeless Population", help="column to project")
+    parser.add_argument("--group", nargs="*", default=[], help="columns identifying a region (e.g. State)")
+    parser.add_argument("--date", default=None, help="per-night date column, if the CSV is not yearly")
+    parser.add_argument("--population-keys", nargs="*", default=None,
+                        help="columns the population column is given for, if finer than --group")
+    parser.add_argument("--out", default=SITE_DIR, help="output directory")
+    parser.add_argument("--horizon", type=int, default=2030, help="last year to project")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    df = read_yearly(args.csv, args.value, region_cols=args.group, date_col=args.date,
+                     population_keys=args.population_keys)
+    build_site(df, args.value, args.group, args.out, args.horizon, args.workers)
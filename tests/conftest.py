@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The projects are plain script folders, not packages; make their modules importable
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "Homeless Data"))
@@ -0,0 +1,87 @@
+import warnings
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+from ingest import read_yearly
+
+POPULATION = {"CA": 39_000_000.0, "NY": 19_000_000.0, "TX": 30_000_000.0}
+
+
+@pytest.fixture
+def nightly_csv(tmp_path):
+    # Per-shelter, per-night rows; states appear in different orders per chunk,
+    # so each chunk's categorical region column has different categories
+    rng = np.random.default_rng(3)
+    n = 6000
+    nights = pd.Timestamp("2019-01-01") + pd.to_timedelta(rng.integers(0, 3 * 365, n), "D")
+    df = pd.DataFrame({
+        "Date": nights.strftime("%Y-%m-%d"),
+        "State": rng.choice(list(POPULATION), n),
+        "Shelter": rng.integers(0, 40, n),
+        "Homeless Population": rng.integers(0, 30, n),
+    })
+    df.loc[:1999, "State"] = "CA"
+    df["Total Population"] = df["State"].map(POPULATION)
+    path = tmp_path / "nightly.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+
+def expected_nightly(df, keys):
+    df = df.assign(Year=pd.to_datetime(df["Date"]).dt.year)
+    nightly = df.groupby(keys + ["Year", "Date"])["Homeless Population"].sum()
+    return nightly.groupby(keys + ["Year"]).max()
+
+
+def test_chunked_matches_full_read(nightly_csv):
+    path, df = nightly_csv
+    got = read_yearly(path, date_col="Date", region_cols=["State"], chunksize=500)
+    expected = expected_nightly(df, ["State"])
+    got = got.set_index(["State", "Year"])
+    pd.testing.assert_series_equal(got["Homeless Population"].sort_index(), expected.sort_index(),
+                                   check_dtype=False, check_index_type=False, check_names=False)
+    assert (got["Total Population"] == got.index.get_level_values("State").map(POPULATION)).all()
+    np.testing.assert_allclose(got["Percent (%)"], got["Homeless Population"] / got["Total Population"] * 100)
+
+
+def test_population_keys_roll_states_up(nightly_csv):
+    path, df = nightly_csv
+    got = read_yearly(path, date_col="Date", population_keys=["State"], chunksize=500)
+    assert (got["Total Population"] == sum(POPULATION.values())).all()
+    expected = expected_nightly(df, [])
+    assert list(got["Homeless Population"]) == list(expected)
+
+
+def test_yearly_rollup_and_unrollable_population(tmp_path):
+    path = tmp_path / "states.csv"
+    pd.DataFrame({
+        "State": ["A", "B"], "Year": [2020, 2020],
+        "Total Population": [100, 200], "Homeless Population": [1, 2],
+    }).to_csv(path, index=False)
+
+    rolled = read_yearly(path, population_keys=["State"], chunksize=1)
+    assert rolled["Total Population"].tolist() == [300]
+    assert rolled["Percent (%)"].tolist() == [1.0]
+
+    with pytest.warns(UserWarning, match="population_keys"):
+        dropped = read_yearly(path, chunksize=1)
+    assert "Total Population" not in dropped and "Percent (%)" not in dropped
+    assert dropped["Homeless Population"].tolist() == [3]
+
+
+def test_report_builds_without_population(tmp_path, monkeypatch):
+    pytest.importorskip("plotly")
+    import HomlessProjection
+
+    path = tmp_path / "counts.csv"
+    pd.DataFrame({"Year": range(2010, 2026), "Homeless Population": range(500, 516)}).to_csv(path, index=False)
+    out = tmp_path / "report.html"
+    HomlessProjection.build_report(str(path), str(out))
+    text = out.read_text(encoding="utf-8")
+    assert "Homeless Population Over Time" in text
+    assert "Homeless Rate" not in text
+    with pytest.raises(SystemExit):
+        HomlessProjection.main(["figure", "rate", "--csv", str(path), "--out", str(tmp_path / "r.html")])
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+import projection_engine as pe
+
+DATA_FILE = Path(__file__).resolve().parent.parent / "Homeless Data" / "HomlessData.csv"
+
+
+def ragged_frame():
+    # A: full, linear-ish with noise; B: starts late and has a gap; C: short
+    rng = np.random.default_rng(0)
+    rows = [("A", y, 1000 + 20 * (y - 2000) + rng.normal(0, 15)) for y in range(2000, 2021)]
+    rows += [("B", y, 50 + (y - 2005) ** 1.5 + rng.normal(0, 2)) for y in range(2005, 2021) if y != 2012]
+    rows += [("C", y, 300 - 4 * (y - 2014) + rng.normal(0, 3)) for y in range(2014, 2021)]
+    return pd.DataFrame(rows, columns=["State", "Year", "v"])
+
+
+def test_poly2_matches_polyfit():
+    data = pd.read_csv(DATA_FILE, thousands=",")
+    keys, years, Y = pe.stack_series(data, "Homeless Population")
+    ours = pe._project("poly", 2, years, Y, years)[0]
+    reference = np.poly1d(np.polyfit(years, Y[0], 2))(years)
+    np.testing.assert_allclose(ours, reference, rtol=1e-6)
+
+
+def test_models_share_one_evaluation_set():
+    scores = pe.fit_projections(ragged_frame(), "v", group_cols=["State"])["scores"]
+    scored = scores[scores["rmse"].notna()]
+    # every model that was scored on a series saw exactly the same forecasts
+    assert (scored.groupby("State")["n_forecasts"].nunique() == 1).all()
+    assert (scored["n_forecasts"] > 0).all()
+
+
+def test_holt_late_start_and_single_point():
+    late = pe.fit_projections(ragged_frame(), "v", group_cols=["State"])
+    forecast = late["forecast"]
+    assert forecast["predicted"].notna().all()
+
+    single = pe.fit_projections(pd.DataFrame({"Year": [2020], "v": [5.0]}), "v")
+    # nothing to validate against: no model may claim a perfect score
+    assert single["scores"]["rmse"].isna().all()
+    assert (single["scores"]["n_forecasts"] == 0).all()
+
+
+def test_batched_equals_per_series():
+    keys, years, Y = pe.stack_series(ragged_frame(), "v", group_cols=["State"])
+    batched = pe.cross_validate(years, Y)
+    for s in range(len(keys)):
+        alone = pe.cross_validate(years, Y[[s]])
+        for name in pe.DEFAULT_MODELS:
+            for col in pe.METRICS + ("n_forecasts",):
+                np.testing.assert_allclose(batched[name][col][s], alone[name][col][0],
+                                           rtol=1e-9, equal_nan=True, err_msg=f"{keys[s]} {name} {col}")
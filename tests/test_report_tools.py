@@ -0,0 +1,60 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+px = pytest.importorskip("plotly.express")
+go = pytest.importorskip("plotly.graph_objects")
+
+from report_tools import downsample_figure, lttb, paged_table_html
+import HomlessProjection
+
+
+def test_lttb_keeps_endpoints_order_and_spikes():
+    x = np.arange(100_000)
+    y = np.sin(x / 500.0)
+    y[54_321] = 50.0
+    idx = lttb(x, y, 1000)
+    assert len(idx) == 1000
+    assert idx[0] == 0 and idx[-1] == len(x) - 1
+    assert (np.diff(idx) > 0).all()
+    assert 54_321 in idx
+
+
+def test_lttb_short_series_untouched():
+    assert list(lttb(np.arange(10), np.arange(10), 100)) == list(range(10))
+
+
+def test_downsample_only_ordered_line_traces():
+    rng = np.random.default_rng(0)
+    fig = go.Figure([
+        go.Scatter(x=rng.random(5000), y=rng.random(5000), mode="markers"),
+        go.Scatter(x=rng.random(5000), y=rng.random(5000), mode="lines"),
+        go.Scatter(x=np.arange(5000), y=rng.random(5000), mode="lines+markers"),
+    ])
+    downsample_figure(fig, 200)
+    assert [len(t.x) for t in fig.data] == [5000, 5000, 200]
+
+
+def test_downsample_keeps_hover_data_in_sync():
+    df = pd.DataFrame({"x": np.arange(5000), "y": np.sin(np.arange(5000) / 50.0)})
+    df["lab"] = [f"p{i}" for i in range(5000)]
+    fig = px.line(df, x="x", y="y", hover_data=["lab"])
+    downsample_figure(fig, 100)
+    trace = fig.data[0]
+    assert len(trace.x) == len(trace.customdata) == 100
+    assert [row[0] for row in trace.customdata] == [f"p{int(i)}" for i in trace.x]
+
+
+def test_paged_table_used_above_page_size():
+    small = pd.DataFrame({"Year": range(10), "v": range(10)})
+    large = pd.DataFrame({"Year": range(100), "v": range(100)})
+    assert isinstance(HomlessProjection.make_table_figure(small, page_size=25), go.Figure)
+
+    table = HomlessProjection.make_table_figure(large, page_size=25)
+    assert isinstance(table, str)
+    assert 'class="paged-table"' in table
+    assert "Summary of all rows" in table
+    assert "var size = 25" in table
+
+    capped = paged_table_html(large, "t", page_size=25, max_rows=50)
+    assert "Showing the first 50 of 100 rows." in capped
@@ -0,0 +1,40 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+STARTUP_BUDGET = 0.1   # seconds for a cold `import <module>`, best of RUNS
+RUNS = 3
+HEAVY_MODULES = ("pandas", "numpy", "plotly", "psycopg2")
+
+IMPORT_AND_TIME = (
+    "import json, sys, time; t = time.perf_counter(); import {module}; "
+    "print(json.dumps([time.perf_counter() - t, "
+    f"[m for m in {HEAVY_MODULES!r} if m in sys.modules]]))"
+)
+
+
+@pytest.mark.parametrize("folder, module", [
+    ("Homeless Data", "HomlessProjection"),
+    ("EcommerceApp", "db_main"),
+])
+def test_cold_import_is_fast_and_lazy(folder, module):
+    timings = []
+    for _ in range(RUNS):
+        proc = subprocess.run(
+            [sys.executable, "-c", IMPORT_AND_TIME.format(module=module)],
+            cwd=ROOT / folder, capture_output=True, text=True,
+        )
+        assert proc.returncode == 0, f"import {module} failed:\n{proc.stderr}"
+        elapsed, loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+        assert not loaded, f"import {module} pulled in heavy modules at startup: {loaded}"
+        timings.append(elapsed)
+
+    best = min(timings)
+    assert best <= STARTUP_BUDGET, (
+        f"import {module} took {best * 1000:.1f} ms, over the {STARTUP_BUDGET * 1000:.0f} ms budget"
+    )
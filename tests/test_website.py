@@ -0,0 +1,33 @@
+import os
+import stat
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("plotly")
+
+import website
+
+
+def frame(states):
+    rows = [(s, y, 100 + 5 * (y - 2010) + i) for i, s in enumerate(states) for y in range(2010, 2021)]
+    return pd.DataFrame(rows, columns=["State", "Year", "Homeless Population"])
+
+
+def test_published_files_are_world_readable(tmp_path):
+    website.build_site(frame(["CA", "NY"]), group_cols=["State"], out_dir=str(tmp_path), workers=1)
+    published = [tmp_path / "index.html", tmp_path / website.PLOTLY_JS,
+                 tmp_path / "regions" / "ca.html", tmp_path / "regions" / "ny.html"]
+    for path in published:
+        assert stat.S_IMODE(os.stat(path).st_mode) == website.FILE_MODE, path
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_stale_pages_and_old_plotly_bundle_are_replaced(tmp_path):
+    website.build_site(frame(["CA", "NY"]), group_cols=["State"], out_dir=str(tmp_path), workers=1)
+    (tmp_path / website.PLOTLY_JS).write_text("/* old plotly.js */", encoding="utf-8")
+
+    website.build_site(frame(["CA", "TX"]), group_cols=["State"], out_dir=str(tmp_path), workers=1)
+    pages = sorted(p.name for p in (tmp_path / "regions").iterdir())
+    assert pages == ["ca.html", "tx.html"]
+    assert (tmp_path / website.PLOTLY_JS).read_text(encoding="utf-8") != "/* old plotly.js */"